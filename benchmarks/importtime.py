@@ -0,0 +1,106 @@
+"""
+Import time regression benchmark.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters and reports
+cumulative import time of typenum modules. Fails when a module pulls in imports it
+must not need, or when import time exceeds given budget.
+
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --runs 10 --budget typenum=15000 --budget typenum.pydantic=120000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import typing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules which must not be imported by importing key
+FORBIDDEN: dict[str, tuple[str, ...]] = {
+    "typenum": (
+        "annotated_types",
+        "typing_extensions",
+        "pydantic",
+        "pydantic_core",
+    ),
+    "typenum.pydantic": (
+        "pydantic.json_schema",
+        "typenum.pydantic.serialization.externally",
+        "typenum.pydantic.serialization.adjacently",
+        "typenum.pydantic.serialization.internally",
+    ),
+}
+
+
+class ImportTime(typing.NamedTuple):
+    cumulative_us: int
+    modules: frozenset[str]
+
+
+def measure(code: str) -> ImportTime:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _self_us, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        # Top level module is not indented
+        if not name.startswith("  "):
+            cumulative_us = int(cumulative)
+
+    return ImportTime(cumulative_us, frozenset(modules))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="interpreter runs per module, best is reported")
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="MODULE=US",
+        help="fail when best cumulative import time of MODULE exceeds US microseconds",
+    )
+    args = parser.parse_args()
+
+    budgets = {}
+    for budget in args.budget:
+        module, us = budget.split("=", maxsplit=1)
+        budgets[module] = int(us)
+
+    # Interpreter startup imports are not ours
+    startup = measure("pass").modules
+
+    failed = False
+    for module, forbidden in FORBIDDEN.items():
+        results = [measure(f"import {module}") for _ in range(args.runs)]
+        best = min(result.cumulative_us for result in results)
+        imported = results[0].modules - startup
+
+        print(f"{module:<20} {best:>10} us")
+
+        for name in forbidden:
+            if name in imported:
+                print(f"  FAIL: `import {module}` imports `{name}`")
+                failed = True
+
+        if (budget := budgets.get(module)) is not None and best > budget:
+            print(f"  FAIL: {best} us exceeds budget {budget} us")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
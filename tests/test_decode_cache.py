@@ -0,0 +1,157 @@
+import typing
+
+import pydantic
+import pytest
+from typing_extensions import Annotated
+
+from typenum import NoValue, TypEnumContent
+from typenum.pydantic import DecodeCacheInfo, Rename, TypEnumPydantic
+
+
+class CachedEnum(TypEnumPydantic[TypEnumContent], decode_cache=2):
+    Ping: type['CachedEnum[NoValue]']
+    Int: type['CachedEnum[int]']
+    List: Annotated[type['CachedEnum[list[int]]'], Rename("list")]
+    Nested: type['CachedEnum[CachedEnum[typing.Any]]']
+
+
+class AdjacentlyCachedEnum(TypEnumPydantic[TypEnumContent], variant="t", content="c", decode_cache=2):
+    Ping: type['AdjacentlyCachedEnum[NoValue]']
+    Int: type['AdjacentlyCachedEnum[int]']
+
+
+class PlainEnum(TypEnumPydantic[TypEnumContent]):
+    Int: type['PlainEnum[int]']
+
+
+cached = pydantic.TypeAdapter(CachedEnum[typing.Any])
+adjacently_cached = pydantic.TypeAdapter(AdjacentlyCachedEnum[typing.Any])
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    assert CachedEnum.__decode_cache__ is not None
+    assert AdjacentlyCachedEnum.__decode_cache__ is not None
+    CachedEnum.__decode_cache__.clear()
+    AdjacentlyCachedEnum.__decode_cache__.clear()
+
+
+def info(kls: typing.Any) -> DecodeCacheInfo:
+    return kls.__decode_cache__.info()  # type: ignore
+
+
+def test_hit_returns_shared_instance() -> None:
+    first = cached.validate_json('"Ping"')
+    second = cached.validate_json('"Ping"')
+
+    assert first is second
+    assert first == CachedEnum.Ping(...)
+    assert info(CachedEnum) == DecodeCacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+
+
+def test_coerced_input_is_not_cached() -> None:
+    assert cached.validate_json('{"Int": true}') is not cached.validate_json('{"Int": true}')
+    assert cached.validate_json('{"Int": "5"}') is not cached.validate_json('{"Int": "5"}')
+    assert info(CachedEnum).currsize == 0
+
+
+def test_strict_mode_is_not_bypassed() -> None:
+    assert cached.validate_json('{"Int": "5"}') == CachedEnum.Int(5)
+
+    with pytest.raises(pydantic.ValidationError):
+        cached.validate_json('{"Int": "5"}', strict=True)
+
+
+def test_mode_is_part_of_key() -> None:
+    assert cached.validate_json('{"Int": 1}') is not cached.validate_python({"Int": 1})
+    assert info(CachedEnum).currsize == 2
+
+
+def test_validation_context_skips_cache() -> None:
+    assert cached.validate_json('"Ping"', context={}) is not cached.validate_json('"Ping"', context={})
+    assert info(CachedEnum) == DecodeCacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0)
+
+
+def test_eviction_is_lru() -> None:
+    ping = cached.validate_json('"Ping"')
+    cached.validate_json('{"Int": 1}')
+    cached.validate_json('"Ping"')
+    int_2 = cached.validate_json('{"Int": 2}')
+
+    assert info(CachedEnum) == DecodeCacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+    assert cached.validate_json('"Ping"') is ping
+
+    int_1 = cached.validate_json('{"Int": 1}')
+    assert cached.validate_json('{"Int": 1}') is int_1
+    assert cached.validate_json('{"Int": 2}') is not int_2
+    assert info(CachedEnum) == DecodeCacheInfo(hits=3, misses=5, evictions=3, maxsize=2, currsize=2)
+
+
+def test_mutable_variant_is_excluded() -> None:
+    first = cached.validate_json('{"list": [1]}')
+    second = cached.validate_json('{"list": [1]}')
+
+    assert first is not second
+    assert first == CachedEnum.List([1])
+    assert info(CachedEnum) == DecodeCacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0)
+
+
+def test_nested_enum_is_cached_by_value() -> None:
+    assert cached.validate_json('{"Nested": "Ping"}') is cached.validate_json('{"Nested": "Ping"}')
+    assert cached.validate_json('{"Nested": {"list": [1]}}') is not cached.validate_json('{"Nested": {"list": [1]}}')
+
+
+def test_cached_instances_are_frozen() -> None:
+    value = cached.validate_json('{"Nested": {"Int": 1}}')
+
+    with pytest.raises(AttributeError):
+        value.value = None
+    assert isinstance(value.value, CachedEnum.Int)
+    with pytest.raises(AttributeError):
+        value.value.value = 2
+
+    assert type(value) is CachedEnum.Nested
+    assert CachedEnum.__variants__[type(value)] == "Nested"
+    assert repr(value) == "CachedEnum.Nested(CachedEnum.Int(1))"
+    assert cached.dump_python(value, mode="json") == {"Nested": {"Int": 1}}
+
+
+def test_frozen_instance_equality() -> None:
+    value = cached.validate_json('{"Int": 1}')
+
+    assert value == CachedEnum.Int(1)
+    assert CachedEnum.Int(1) == value
+    assert value != CachedEnum.Int(2)
+
+
+def test_adjacently_tagged() -> None:
+    value = adjacently_cached.validate_json('{"t": "Int", "c": 1}')
+
+    assert adjacently_cached.validate_json('{"t": "Int", "c": 1}') is value
+    assert info(AdjacentlyCachedEnum).hits == 1
+
+
+def test_invalid_input_is_not_cached() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        cached.validate_json('{"Int": "a"}')
+
+    assert info(CachedEnum).currsize == 0
+
+
+def test_uncached_enum_has_no_cache() -> None:
+    value = PlainEnum.Int(1)
+    value.value = 2
+
+    assert PlainEnum.__decode_cache__ is None
+    assert value == PlainEnum.Int(2)
+
+
+def test_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        class _InvalidEnum(TypEnumPydantic[TypEnumContent], decode_cache=0):
+            Int: type['_InvalidEnum[int]']
+
+
+def test_restore_without_variant_passes_through() -> None:
+    assert cached.validate_python({}) is None
+    assert info(CachedEnum).currsize == 0
@@ -0,0 +1,85 @@
+import typing
+
+import pydantic
+import pytest
+from pydantic.alias_generators import to_camel
+from typing_extensions import TypedDict
+
+from typenum import NoValue, TypEnumContent
+from typenum.pydantic import TypEnumPydantic
+
+
+class SchemaEnum(TypEnumPydantic[TypEnumContent]):
+    Ping: type['SchemaEnum[NoValue]']
+    Int: type['SchemaEnum[int]']
+
+
+class Arbitrary:
+    pass
+
+
+class ArbitraryEnum(TypEnumPydantic[TypEnumContent]):
+    Value: type['ArbitraryEnum[Arbitrary]']
+
+
+class Payload(TypedDict):
+    some_field: int
+
+
+class PayloadEnum(TypEnumPydantic[TypEnumContent]):
+    P: type['PayloadEnum[Payload]']
+
+
+def test_core_schema_is_built_once() -> None:
+    class First(pydantic.BaseModel):
+        e: SchemaEnum[typing.Any]
+
+    schema = SchemaEnum.__core_schemas__[frozenset()]
+
+    class Second(pydantic.BaseModel):
+        e: SchemaEnum[typing.Any]
+
+    assert schema is not False
+    assert SchemaEnum.__core_schemas__[frozenset()] is schema
+    assert Second.model_validate_json('{"e": {"Int": 1}}').e == SchemaEnum.Int(1)
+
+
+def test_core_schema_depends_on_model_config() -> None:
+    class Plain(pydantic.BaseModel):
+        e: PayloadEnum[typing.Any]
+
+    class Camel(pydantic.BaseModel):
+        model_config = pydantic.ConfigDict(alias_generator=to_camel)
+
+        e: PayloadEnum[typing.Any]
+
+    assert Plain.model_validate_json('{"e": {"P": {"some_field": 1}}}').e == PayloadEnum.P({"some_field": 1})
+    assert Camel.model_validate_json('{"e": {"P": {"someField": 1}}}').e == PayloadEnum.P({"some_field": 1})
+    with pytest.raises(pydantic.ValidationError):
+        Camel.model_validate_json('{"e": {"P": {"some_field": 1}}}')
+    with pytest.raises(pydantic.ValidationError):
+        Plain.model_validate_json('{"e": {"P": {"someField": 1}}}')
+
+
+def test_standalone_build_failure_is_remembered() -> None:
+    with pytest.raises(pydantic.PydanticSchemaGenerationError):
+        pydantic.TypeAdapter(ArbitraryEnum[typing.Any])
+
+    assert ArbitraryEnum.__core_schemas__[frozenset()] is False
+
+    class Model(pydantic.BaseModel):
+        model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+        e: ArbitraryEnum[typing.Any]
+
+    value = Arbitrary()
+
+    assert Model(e=ArbitraryEnum.Value(value)).e.value is value
+
+
+def test_json_schema() -> None:
+    schema = SchemaEnum.json_schema()
+
+    assert schema["anyOf"][1] == {"pattern": "Ping", "type": "string"}
+    assert schema == SchemaEnum.json_schema()
+    assert schema is not SchemaEnum.json_schema()
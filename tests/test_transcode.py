@@ -0,0 +1,116 @@
+import typing
+
+import pydantic
+import pytest
+from typing_extensions import Annotated, TypedDict
+
+from typenum import NoValue, TypEnumContent
+from typenum.pydantic import Rename, TypEnumPydantic
+from typenum.pydantic.serialization import AdjacentlyTagged, ExternallyTagged, InternallyTagged
+
+
+class Obj(TypedDict):
+    a: int
+
+
+class Inner(TypEnumPydantic[TypEnumContent]):
+    Ping: type['Inner[NoValue]']
+    Int: type['Inner[int]']
+
+
+class Outer(TypEnumPydantic[TypEnumContent], variant="t", content="c"):
+    Ping: type['Outer[NoValue]']
+    Int: type['Outer[int]']
+    Obj: Annotated[type['Outer[Obj]'], Rename("object")]
+    Self: type['Outer[Outer[typing.Any]]']
+    Inner: type['Outer[Inner[typing.Any]]']
+
+
+class Containers(TypEnumPydantic[TypEnumContent], variant="t", content="c"):
+    List: type['Containers[list[Inner[typing.Any]]]']
+    Optional: type['Containers[typing.Optional[Inner[typing.Any]]]']
+    Tuple: type['Containers[tuple[int, Inner[typing.Any]]]']
+    Dict: type['Containers[dict[str, Inner[typing.Any]]]']
+    Union: type['Containers[typing.Union[int, Inner[typing.Any]]]']
+
+
+externally = ExternallyTagged()
+adjacently = AdjacentlyTagged("t", "c")
+internally = InternallyTagged("t")
+
+
+@pytest.mark.parametrize(("adjacent", "external"), [
+    ({"t": "Ping"}, "Ping"),
+    ({"t": "Int", "c": 1}, {"Int": 1}),
+    ({"t": "object", "c": {"a": 1}}, {"object": {"a": 1}}),
+    ({"t": "Self", "c": {"t": "Self", "c": {"t": "Ping"}}}, {"Self": {"Self": "Ping"}}),
+])
+def test_round_trip(adjacent: typing.Any, external: typing.Any) -> None:
+    assert Outer.transcode(adjacent, src=adjacently, dst=externally) == external
+    assert Outer.transcode(external, src=externally, dst=adjacently) == adjacent
+
+
+def test_matches_serialization() -> None:
+    adapter = pydantic.TypeAdapter(Outer[typing.Any])
+    value = Outer.Self(Outer.Obj({"a": 1}))
+
+    assert Outer.transcode(adapter.dump_python(value, mode="json")) == adapter.dump_python(value, mode="json")
+
+
+def test_internally_tagged() -> None:
+    assert Outer.transcode({"t": "object", "c": {"a": 1}}, dst=internally) == {"t": "object", "a": 1}
+    assert Outer.transcode({"t": "object", "a": 1}, src=internally) == {"t": "object", "c": {"a": 1}}
+    assert Outer.transcode({"t": "Ping"}, src=internally, dst=externally) == "Ping"
+
+
+def test_nested_enum_uses_own_representation() -> None:
+    assert Outer.transcode({"t": "Inner", "c": {"Int": 1}}) == {"t": "Inner", "c": {"Int": 1}}
+    assert Outer.transcode({"t": "Inner", "c": "Ping"}, dst=externally) == {"Inner": "Ping"}
+
+
+def test_ndjson() -> None:
+    lines: list[typing.Union[str, bytes]] = [b'{"t":"Int","c":5}\n', b"\n", '{"t":"Ping"}']
+
+    assert list(Outer.transcode_ndjson(lines, dst=externally)) == [b'{"Int":5}\n', b'"Ping"\n']
+
+
+@pytest.mark.parametrize(("own", "adjacent"), [
+    ({"t": "List", "c": [{"Int": 1}, "Ping"]}, {"t": "List", "c": [{"t": "Int", "c": 1}, {"t": "Ping"}]}),
+    ({"t": "Optional", "c": "Ping"}, {"t": "Optional", "c": {"t": "Ping"}}),
+    ({"t": "Optional", "c": None}, {"t": "Optional", "c": None}),
+    ({"t": "Tuple", "c": [1, "Ping"]}, {"t": "Tuple", "c": [1, {"t": "Ping"}]}),
+    ({"t": "Dict", "c": {"k": {"Int": 1}}}, {"t": "Dict", "c": {"k": {"t": "Int", "c": 1}}}),
+])
+def test_enum_inside_container(own: typing.Any, adjacent: typing.Any) -> None:
+    assert Containers.transcode(own, dst=adjacently) == adjacent
+    assert Containers.transcode(adjacent, src=adjacently) == own
+
+
+@pytest.mark.parametrize("raw", [
+    {"t": "Union", "c": "Ping"},
+    {"t": "List", "c": {"Int": 1}},
+    {"t": "Tuple", "c": [1]},
+])
+def test_enum_inside_container_malformed(raw: typing.Any) -> None:
+    with pytest.raises(ValueError):
+        Containers.transcode(raw, dst=adjacently)
+
+
+@pytest.mark.parametrize(("raw", "src", "dst"), [
+    ({"t": "Unknown"}, adjacently, externally),
+    ({"t": 1}, adjacently, externally),
+    ({"c": 1}, adjacently, externally),
+    ({"t": "Int"}, adjacently, externally),
+    ({"t": "Ping", "c": 5}, adjacently, externally),
+    ({"t": "Int", "c": 1, "junk": 2}, adjacently, externally),
+    ({"Ping": 5}, externally, adjacently),
+    ("Int", externally, adjacently),
+    ({"t": "Ping", "a": 1}, internally, adjacently),
+    ({"Int": 1, "Ping": None}, externally, adjacently),
+    ([1], externally, adjacently),
+    ({"t": "Int", "c": 1}, adjacently, internally),
+    ({"t": "object", "c": {"t": "Int"}}, adjacently, internally),
+])
+def test_malformed(raw: typing.Any, src: typing.Any, dst: typing.Any) -> None:
+    with pytest.raises(ValueError):
+        Outer.transcode(raw, src=src, dst=dst)
@@ -8,10 +8,12 @@ __all__ = [
     "TypEnumMeta",
 ]
 
-import typing_extensions
+if typing.TYPE_CHECKING:
+    # Core must not import optional dependencies at runtime, these are for annotations only
+    import typing_extensions
 
-from annotated_types import BaseMetadata
-from typing_extensions import Annotated
+    from annotated_types import BaseMetadata
+    from typing_extensions import Annotated
 
 TypEnumContent = typing.TypeVar("TypEnumContent")
 
@@ -118,7 +120,7 @@ class _TypEnum(typing.Generic[TypEnumContent], metaclass=TypEnumMeta):
 
     __is_variant__: typing.ClassVar[bool] = False
 
-    __abstract__: typing_extensions.Never
+    __abstract__: "typing_extensions.Never"
 
     value: typing.Optional[TypEnumContent]
 
@@ -141,4 +143,4 @@ class _TypEnum(typing.Generic[TypEnumContent], metaclass=TypEnumMeta):
 
 
 class TypEnum(_TypEnum[TypEnumContent]):
-    __abstract__: typing_extensions.Never
+    __abstract__: "typing_extensions.Never"
@@ -1,9 +1,14 @@
 import pydantic
 
-if tuple(map(int, pydantic.version.VERSION.split('.'))) < (2, 9, 0):
+# Only major.minor matters, so pre-release suffixes don't break parsing
+if tuple(map(int, pydantic.VERSION.split('.')[:2])) < (2, 9):
     raise ValueError("Pydantic version must be >=2.9.0")
 
 
+from .cache import (
+    DecodeCache,
+    DecodeCacheInfo,
+)
 from .core import (
     Rename,
     TypEnumPydantic,
@@ -12,6 +17,8 @@ from .core import (
 
 
 __all__ = [
+    "DecodeCache",
+    "DecodeCacheInfo",
     "FieldMetadata",
     "Rename",
     "TypEnumPydantic",
@@ -0,0 +1,224 @@
+import inspect
+import threading
+import typing
+from collections import OrderedDict
+
+from pydantic_core import core_schema
+from pydantic_core.core_schema import ValidationInfo, ValidatorFunctionWrapHandler
+
+from typenum.core import NoValue
+
+if typing.TYPE_CHECKING:
+    from .core import TypEnumPydantic
+
+__all__ = [
+    "DecodeCache",
+    "DecodeCacheInfo",
+]
+
+
+# Content types whose values can't be changed in place, so variant holding them can be shared safely
+_IMMUTABLE_CONTENT_TYPES: tuple[typing.Any, ...] = (NoValue, bool, int, float, str, bytes, type(None))
+
+_Key = typing.Hashable
+
+
+class DecodeCacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _canonical_key(value: typing.Any) -> typing.Optional[_Key]:
+    # Hashable key of primitive input, scalars keep type so `1`, `1.0` and `True` differ
+    if isinstance(value, str):
+        return str, value
+    elif isinstance(value, dict):
+        items = []
+        for k, v in value.items():
+            if not isinstance(k, str) or (v_key := _canonical_key(v)) is None:
+                return None
+            items.append((k, v_key))
+        return dict, tuple(items)
+    elif isinstance(value, list):
+        list_items = []
+        for v in value:
+            if (v_key := _canonical_key(v)) is None:
+                return None
+            list_items.append(v_key)
+        return list, tuple(list_items)
+    elif value is None or isinstance(value, (bool, int, float)):
+        return type(value), value
+    return None
+
+
+def _is_cacheable(instance: typing.Any, input_value: typing.Any) -> bool:
+    from typenum.pydantic.core import TypEnumPydantic
+
+    # Restore result isn't an enum when input came from other union member
+    if not isinstance(instance, TypEnumPydantic) or instance.__decode_cache__ is None:
+        return False
+
+    peeked = instance.__serialization__.__peek_variant__(type(instance), input_value)
+    if peeked is None or peeked[0] != instance.__variant_name__:
+        return False
+
+    content = peeked[1]
+    if instance.__content_type__ is NoValue:
+        return True
+
+    if isinstance(instance.value, TypEnumPydantic):
+        return _is_cacheable(instance.value, content)
+
+    # Content without coercion, so strict validation gives the same value
+    return (
+            any(instance.content_type() is t for t in _IMMUTABLE_CONTENT_TYPES) and
+            type(content) is type(instance.value)
+    )
+
+
+def _frozen_setattr(self: typing.Any, name: str, value: typing.Any) -> None:
+    if self.__dict__.get("__frozen__"):
+        raise AttributeError(f"{self.__full_variant_name__} is shared by decode cache and can't be modified")
+    object.__setattr__(self, name, value)
+
+
+def _frozen_delattr(self: typing.Any, name: str) -> None:
+    if self.__dict__.get("__frozen__"):
+        raise AttributeError(f"{self.__full_variant_name__} is shared by decode cache and can't be modified")
+    object.__delattr__(self, name)
+
+
+def _freeze(instance: "TypEnumPydantic[typing.Any]") -> None:
+    from typenum.pydantic.core import TypEnumPydantic
+
+    if isinstance(instance.value, TypEnumPydantic):
+        _freeze(instance.value)
+    object.__setattr__(instance, "__frozen__", True)
+
+
+class DecodeCache:
+    """
+    Size-bounded LRU cache of restored enum instances, keyed on validation mode and primitive input.
+
+    Only variants with immutable content (NoValue, bool, int, float, str, bytes, None and
+    nested cached enums holding the same) are stored, when input needs no coercion.
+    Cached instances are shared and frozen, their class stays the variant class.
+    """
+    _maxsize: int
+    _enum: type["TypEnumPydantic[typing.Any]"]
+
+    def __init__(self, maxsize: int):
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize <= 0:
+            raise ValueError(f"Decode cache size must be a positive integer, got {maxsize!r}")
+
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._store: OrderedDict[_Key, "TypEnumPydantic[typing.Any]"] = OrderedDict()
+        # True - always cacheable, None - depends on nested enum value, False - never
+        self._variants: dict[str, typing.Optional[bool]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def bind(self, kls: type["TypEnumPydantic[typing.Any]"]) -> None:
+        # Only enums with cache pay for frozen check on attribute assignment
+        self._enum = kls
+        setattr(kls, "__setattr__", _frozen_setattr)
+        setattr(kls, "__delattr__", _frozen_delattr)
+
+    def _variant_cacheable(self, attr: str) -> typing.Optional[bool]:
+        from typenum.pydantic.core import TypEnumPydantic
+
+        if attr in self._variants:
+            return self._variants[attr]
+
+        enum_variant = getattr(self._enum, attr, None)
+        if enum_variant is None or enum_variant not in self._enum.__variants__:
+            # Unknown names come from input, so they aren't remembered
+            return False
+
+        try:
+            content_type = enum_variant.content_type()
+        except NameError:
+            return False
+
+        origin = typing.get_origin(content_type) or content_type
+        cacheable: typing.Optional[bool]
+        if any(content_type is t for t in _IMMUTABLE_CONTENT_TYPES):
+            cacheable = True
+        elif inspect.isclass(origin) and issubclass(origin, TypEnumPydantic) and origin.__decode_cache__ is not None:
+            cacheable = None
+        else:
+            cacheable = False
+
+        self._variants[attr] = cacheable
+        return cacheable
+
+    def _wrap_validator(
+            self,
+            input_value: typing.Any,
+            handler: ValidatorFunctionWrapHandler,
+            info: ValidationInfo,
+    ) -> typing.Any:
+        if info.context is not None:
+            return handler(input_value)
+
+        peeked = self._enum.__serialization__.__peek_variant__(self._enum, input_value)
+        if peeked is None or self._variant_cacheable(peeked[0]) is False:
+            return handler(input_value)
+
+        if (input_key := _canonical_key(input_value)) is None:
+            return handler(input_value)
+
+        key = (info.mode, input_key)
+        with self._lock:
+            cached = self._store.get(key)
+            if cached is not None:
+                self._store.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        result = handler(input_value)
+        if not _is_cacheable(result, input_value):
+            return result
+
+        _freeze(result)
+        with self._lock:
+            self._store[key] = result
+            self._store.move_to_end(key)
+            if len(self._store) > self._maxsize:
+                self._store.popitem(last=False)
+                self._evictions += 1
+
+        return result
+
+    def wrap_schema(self, schema: core_schema.CoreSchema) -> core_schema.CoreSchema:
+        # Ref and serialization go on wrapper, so references to enum hit the cache too
+        inner = dict(schema)
+        ref = inner.pop("ref", None)
+        serialization = inner.pop("serialization", None)
+        return core_schema.with_info_wrap_validator_function(
+            self._wrap_validator,
+            typing.cast(core_schema.CoreSchema, inner),
+            ref=ref,
+            serialization=serialization,
+        )
+
+    def info(self) -> DecodeCacheInfo:
+        with self._lock:
+            return DecodeCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._store),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._hits = self._misses = self._evictions = 0
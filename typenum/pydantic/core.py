@@ -1,5 +1,7 @@
+import copy
 import importlib
 import inspect
+import types
 import typing
 import pydantic as pydantic_
 
@@ -7,10 +9,10 @@ from dataclasses import dataclass
 
 import typing_extensions
 from annotated_types import GroupedMetadata, BaseMetadata
-from pydantic_core import core_schema
+from pydantic_core import core_schema, from_json, to_json
 from pydantic_core.core_schema import ValidationInfo, SerializerFunctionWrapHandler
 
-from typenum.core import TypEnumMeta, _TypEnum, TypEnumContent
+from typenum.core import TypEnumMeta, _TypEnum, TypEnumContent, NoValue
 
 __all__ = [
     "Rename",
@@ -20,9 +22,13 @@ __all__ = [
     "eval_content_type",
 ]
 
-from typenum.pydantic.serialization import AdjacentlyTagged, InternallyTagged, ExternallyTagged
+from typenum.pydantic import serialization
+from typenum.pydantic.cache import DecodeCache
 from typenum.pydantic.serialization.tagged import TaggedSerialization
 
+if typing.TYPE_CHECKING:
+    from pydantic.json_schema import GenerateJsonSchema, JsonSchemaMode
+
 
 @dataclass(frozen=True, slots=True)
 class Rename(BaseMetadata):
@@ -45,8 +51,66 @@ def eval_content_type(cls: type['TypEnumPydantic[TypEnumContent]']) -> type:
     return eval(cls.__content_type__, module.__dict__)  # type: ignore
 
 
+def _model_config(handler: pydantic_.GetCoreSchemaHandler) -> typing.Optional[tuple[typing.Hashable, typing.Any]]:
+    # Enclosing model config changes content schema (aliases, strictness), None when unknown or unhashable
+    config_wrapper = getattr(getattr(handler, "_generate_schema", None), "_config_wrapper", None)
+    if config_wrapper is None:
+        return None
+
+    try:
+        return frozenset(config_wrapper.config_dict.items()), config_wrapper.config_dict
+    except TypeError:
+        return None
+
+
+def _contains_enum(content_type: typing.Any) -> bool:
+    origin = typing.get_origin(content_type) or content_type
+    if inspect.isclass(origin) and issubclass(origin, TypEnumPydantic):
+        return True
+    return any(_contains_enum(arg) for arg in typing.get_args(content_type))
+
+
+def _transcode_content(
+        kls: type["TypEnumPydantic[TypEnumContent]"],
+        content_type: typing.Any,
+        content: typing.Any,
+        src: typing.Optional[TaggedSerialization],
+        dst: typing.Optional[TaggedSerialization],
+) -> typing.Any:
+    if not _contains_enum(content_type):
+        return content
+
+    origin = typing.get_origin(content_type) or content_type
+    args = typing.get_args(content_type)
+    if origin is typing.Annotated:
+        return _transcode_content(kls, args[0], content, src, dst)
+    elif inspect.isclass(origin) and issubclass(origin, TypEnumPydantic):
+        return origin.transcode(content, src, dst)
+    elif origin in (typing.Union, types.UnionType):
+        # Only Optional is unambiguous, other unions would need validation to pick a member
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return None if content is None else _transcode_content(kls, members[0], content, src, dst)
+    elif origin is list and isinstance(content, list):
+        return [_transcode_content(kls, args[0], item, src, dst) for item in content]
+    elif origin is tuple and isinstance(content, list):
+        if len(args) == 2 and args[1] is Ellipsis:
+            return [_transcode_content(kls, args[0], item, src, dst) for item in content]
+        if len(args) == len(content):
+            return [_transcode_content(kls, arg, item, src, dst) for arg, item in zip(args, content)]
+    elif origin is dict and isinstance(content, dict) and not _contains_enum(args[0]):
+        return {key: _transcode_content(kls, args[1], value, src, dst) for key, value in content.items()}
+
+    raise ValueError(f"{kls.__name__}: can't transcode {content!r} as `{content_type}`")
+
+
 class TypEnumPydanticMeta(TypEnumMeta):
     __serialization__: TaggedSerialization
+    __decode_cache__: typing.Optional[DecodeCache]
+
+    __core_schemas__: dict[typing.Hashable, typing.Union[core_schema.CoreSchema, typing.Literal[False]]]
+    __core_schema_building__: bool
+    __json_schemas__: dict[tuple[typing.Any, ...], dict[str, typing.Any]]
 
     def __new__(
             cls,
@@ -55,6 +119,7 @@ class TypEnumPydanticMeta(TypEnumMeta):
             class_dict: dict[str, typing.Any],
             variant: typing.Optional[str] = None,
             content: typing.Optional[str] = None,
+            decode_cache: typing.Optional[int] = None,
     ) -> typing.Any:
         enum_class = super().__new__(cls, cls_name, bases, class_dict)
         if enum_class.__annotations__.get("__abstract__"):
@@ -69,12 +134,21 @@ class TypEnumPydanticMeta(TypEnumMeta):
         enum_class.__names_serialization__ = dict()
         enum_class.__names_deserialization__ = dict()
 
+        enum_class.__core_schemas__ = dict()
+        enum_class.__core_schema_building__ = False
+        enum_class.__json_schemas__ = dict()
+
         if variant is not None and content is not None:
-            enum_class.__serialization__ = AdjacentlyTagged(variant, content)
+            enum_class.__serialization__ = serialization.AdjacentlyTagged(variant, content)
         elif variant is not None:
-            enum_class.__serialization__ = InternallyTagged(variant)
+            enum_class.__serialization__ = serialization.InternallyTagged(variant)
         else:
-            enum_class.__serialization__ = ExternallyTagged()
+            enum_class.__serialization__ = serialization.ExternallyTagged()
+
+        enum_class.__decode_cache__ = None
+        if decode_cache is not None:
+            enum_class.__decode_cache__ = DecodeCache(decode_cache)
+            enum_class.__decode_cache__.bind(enum_class)
 
         annotation: typing.Union[type[typing_extensions.Annotated[typing.Any, BaseMetadata]], type]
         for attr, annotation in enum_class.__annotations__.items():
@@ -114,6 +188,12 @@ class TypEnumPydantic(_TypEnum[TypEnumContent], metaclass=TypEnumPydanticMeta):
     __names_deserialization__: typing.ClassVar[dict[str, str]]
 
     __serialization__: typing.ClassVar[TaggedSerialization]
+    __decode_cache__: typing.ClassVar[typing.Optional[DecodeCache]]
+
+    # Per model config, False - standalone build impossible, always build in place
+    __core_schemas__: typing.ClassVar[dict[typing.Hashable, typing.Union[core_schema.CoreSchema, typing.Literal[False]]]]
+    __core_schema_building__: typing.ClassVar[bool]
+    __json_schemas__: typing.ClassVar[dict[tuple[typing.Any, ...], dict[str, typing.Any]]]
 
     @classmethod
     def content_type(cls) -> type:
@@ -139,7 +219,110 @@ class TypEnumPydantic(_TypEnum[TypEnumContent], metaclass=TypEnumPydanticMeta):
             source_type: typing.Any,
             handler: pydantic_.GetCoreSchemaHandler,
     ) -> core_schema.CoreSchema:
-        return cls.__serialization__.__get_pydantic_core_schema__(cls, source_type, handler)
+        config = _model_config(handler)
+        if config is None or cls.__core_schema_building__:
+            return cls.__build_core_schema__(source_type, handler)
+
+        config_key, config_dict = config
+        schema = cls.__core_schemas__.get(config_key)
+        if schema is False:
+            return cls.__build_core_schema__(source_type, handler)
+
+        if schema is None:
+            cls.__core_schema_building__ = True
+            try:
+                # Resolve content types in enum module, standalone adapter doesn't see model namespace
+                for enum_variant in cls.__variants__:
+                    enum_variant.content_type()  # type: ignore
+
+                # Standalone schema contains own definitions, so models with same config reuse it
+                schema = pydantic_.TypeAdapter(cls, config=config_dict).core_schema
+                cls.__core_schemas__[config_key] = schema
+            except NameError:
+                # Content isn't declared yet, retry standalone build next time
+                return cls.__build_core_schema__(source_type, handler)
+            except pydantic_.PydanticUserError:
+                # Content can't be built with this config, don't try standalone build again
+                cls.__core_schemas__[config_key] = False
+                return cls.__build_core_schema__(source_type, handler)
+            finally:
+                cls.__core_schema_building__ = False
+
+        # Shallow copy, pydantic moves ref on returned schema
+        return typing.cast(core_schema.CoreSchema, dict(schema))
+
+    @classmethod
+    def __build_core_schema__(
+            cls: type["TypEnumPydantic[TypEnumContent]"],
+            source_type: typing.Any,
+            handler: pydantic_.GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        schema = cls.__serialization__.__get_pydantic_core_schema__(cls, source_type, handler)
+        if cls.__decode_cache__ is not None:
+            schema = cls.__decode_cache__.wrap_schema(schema)
+        return schema
+
+    @classmethod
+    def json_schema(
+            cls,
+            by_alias: bool = True,
+            ref_template: typing.Optional[str] = None,
+            schema_generator: typing.Optional[type["GenerateJsonSchema"]] = None,
+            mode: "JsonSchemaMode" = "validation",
+    ) -> dict[str, typing.Any]:
+        # pydantic.json_schema is heavy, import it only when schema requested
+        from pydantic.json_schema import DEFAULT_REF_TEMPLATE, GenerateJsonSchema
+
+        ref_template = DEFAULT_REF_TEMPLATE if ref_template is None else ref_template
+        schema_generator = GenerateJsonSchema if schema_generator is None else schema_generator
+
+        # Computed once per arguments set, refs don't depend on process, so output can be precomputed
+        key = (by_alias, ref_template, schema_generator, mode)
+        if (schema := cls.__json_schemas__.get(key)) is None:
+            schema = cls.__json_schemas__[key] = pydantic_.TypeAdapter(cls).json_schema(
+                by_alias=by_alias,
+                ref_template=ref_template,
+                schema_generator=schema_generator,
+                mode=mode,
+            )
+        return copy.deepcopy(schema)
+
+    @classmethod
+    def transcode(
+            cls,
+            raw: typing.Any,
+            src: typing.Optional[TaggedSerialization] = None,
+            dst: typing.Optional[TaggedSerialization] = None,
+    ) -> typing.Any:
+        """
+        Rewrite tag envelope of already parsed JSON value from `src` into `dst` representation.
+
+        Content isn't validated and is passed as is, only nested enums content is transcoded
+        with same `src` and `dst`, including enums inside list, tuple, dict values and Optional.
+        Omitted `src` or `dst` means own representation of each enum, nested ones included.
+        """
+        attr, content = (cls.__serialization__ if src is None else src).__untag__(cls, raw)
+
+        content_type = getattr(cls, attr).content_type()
+        if content_type is NoValue:
+            content = None
+        else:
+            content = _transcode_content(cls, content_type, content, src, dst)
+
+        return (cls.__serialization__ if dst is None else dst).__tag__(cls, attr, content)
+
+    @classmethod
+    def transcode_ndjson(
+            cls,
+            lines: typing.Iterable[typing.Union[str, bytes]],
+            src: typing.Optional[TaggedSerialization] = None,
+            dst: typing.Optional[TaggedSerialization] = None,
+    ) -> typing.Iterator[bytes]:
+        # Streaming `transcode`, one JSON document per line, blank lines are skipped
+        for line in lines:
+            if not line.strip():
+                continue
+            yield to_json(cls.transcode(from_json(line), src, dst)) + b"\n"
 
     @classmethod
     def __python_value_restore__(
@@ -1,9 +1,33 @@
-from .externally import ExternallyTagged
-from .adjacently import AdjacentlyTagged
-from .internally import InternallyTagged
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .externally import ExternallyTagged
+    from .adjacently import AdjacentlyTagged
+    from .internally import InternallyTagged
 
 __all__ = [
     "ExternallyTagged",
     "AdjacentlyTagged",
     "InternallyTagged",
 ]
+
+# Every enum uses only one strategy, so these are imported on first access
+_strategies = {
+    "ExternallyTagged": ".externally",
+    "AdjacentlyTagged": ".adjacently",
+    "InternallyTagged": ".internally",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if (module_name := _strategies.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    strategy = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = strategy
+    return strategy
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
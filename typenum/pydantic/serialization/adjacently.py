@@ -6,7 +6,7 @@ from pydantic_core import CoreSchema, core_schema
 from pydantic_core.core_schema import SerializerFunctionWrapHandler, ValidationInfo
 
 from typenum.core import TypEnumContent, NoValue
-from typenum.pydantic.serialization.tagged import TaggedSerialization
+from typenum.pydantic.serialization.tagged import TaggedSerialization, schema_ref
 
 if typing.TYPE_CHECKING:
     from ..core import TypEnumPydantic  # type: ignore
@@ -50,11 +50,11 @@ class AdjacentlyTagged(TaggedSerialization):
             if is_typenum_variant or enum_variant.__content_type__ is NoValue:
                 if is_typenum_variant:
                     kls_: type = enum_variant.__content_type__  # type: ignore
-                    schema_definition = core_schema.definition_reference_schema(f"{kls_.__name__}:{id(kls_)}")
+                    schema_definition = core_schema.definition_reference_schema(schema_ref(kls_))
                     value_schema = core_schema.typed_dict_field(core_schema.definitions_schema(
                         schema=schema_definition,
                         definitions=[
-                            core_schema.any_schema(ref=f"{kls_.__name__}:{id(kls_)}")
+                            core_schema.any_schema(ref=schema_ref(kls_))
                         ],
                     ))
 
@@ -77,7 +77,7 @@ class AdjacentlyTagged(TaggedSerialization):
             serialization=core_schema.wrap_serializer_function_ser_schema(
                 kls.__pydantic_serialization__
             ),
-            ref=f"{kls.__name__}:{id(kls)}"
+            ref=schema_ref(kls)
         )
 
     def __python_value_restore__(
@@ -114,3 +114,47 @@ class AdjacentlyTagged(TaggedSerialization):
             result[self.__content_tag__] = serializer(model.value)
 
         return result
+
+    def __peek_variant__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            input_value: typing.Any,
+    ) -> typing.Optional[tuple[str, typing.Any]]:
+        if not isinstance(input_value, dict) or not isinstance(name := input_value.get(self.__variant_tag__), str):
+            return None
+
+        return kls.__names_deserialization__.get(name, name), input_value.get(self.__content_tag__)
+
+    def __untag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            raw: typing.Any,
+    ) -> tuple[str, typing.Any]:
+        if not isinstance(raw, dict) or self.__variant_tag__ not in raw:
+            raise ValueError(
+                f"{kls.__name__}: adjacently tagged value must be an object with `{self.__variant_tag__}` key"
+            )
+
+        attr = self.__variant_attr__(kls, raw[self.__variant_tag__])
+        if getattr(kls, attr).__content_type__ is NoValue:
+            if len(raw) != 1:
+                raise ValueError(f"{kls.__name__}: variant `{attr}` value must have only `{self.__variant_tag__}` key")
+            return attr, None
+
+        if raw.keys() != {self.__variant_tag__, self.__content_tag__}:
+            raise ValueError(
+                f"{kls.__name__}: variant `{attr}` value must have only "
+                f"`{self.__variant_tag__}` and `{self.__content_tag__}` keys"
+            )
+        return attr, raw[self.__content_tag__]
+
+    def __tag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            attr: str,
+            content: typing.Any,
+    ) -> typing.Any:
+        result = {self.__variant_tag__: kls.__names_serialization__.get(attr, attr)}
+        if getattr(kls, attr).__content_type__ is not NoValue:
+            result[self.__content_tag__] = content
+        return result
@@ -6,7 +6,7 @@ from pydantic_core import CoreSchema, core_schema
 from pydantic_core.core_schema import SerializerFunctionWrapHandler, ValidationInfo
 
 from typenum.core import TypEnumContent, NoValue
-from typenum.pydantic.serialization.tagged import TaggedSerialization
+from typenum.pydantic.serialization.tagged import TaggedSerialization, schema_ref
 
 if typing.TYPE_CHECKING:
     from ..core import TypEnumPydantic  # type: ignore
@@ -43,11 +43,11 @@ class ExternallyTagged(TaggedSerialization):
                     continue
                 else:
                     kls_: type = enum_variant.__content_type__  # type: ignore
-                    schema_definition = core_schema.definition_reference_schema(f"{kls_.__name__}:{id(kls_)}")
+                    schema_definition = core_schema.definition_reference_schema(schema_ref(kls_))
                     item_schema = core_schema.definitions_schema(
                         schema=schema_definition,
                         definitions=[
-                            core_schema.any_schema(ref=f"{kls_.__name__}:{id(kls_)}")
+                            core_schema.any_schema(ref=schema_ref(kls_))
                         ],
                     )
 
@@ -70,7 +70,7 @@ class ExternallyTagged(TaggedSerialization):
             serialization=core_schema.wrap_serializer_function_ser_schema(
                 kls.__pydantic_serialization__
             ),
-            ref=f"{kls.__name__}:{id(kls)}"
+            ref=schema_ref(kls)
         )
 
     def __python_value_restore__(
@@ -108,3 +108,46 @@ class ExternallyTagged(TaggedSerialization):
             content = serializer(model.value)
 
         return {attr: content}
+
+    def __peek_variant__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            input_value: typing.Any,
+    ) -> typing.Optional[tuple[str, typing.Any]]:
+        if isinstance(input_value, str):
+            name, content = input_value, None
+        elif isinstance(input_value, dict) and len(input_value) == 1:
+            [(name, content)] = input_value.items()
+        else:
+            return None
+
+        return kls.__names_deserialization__.get(name, name), content
+
+    def __untag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            raw: typing.Any,
+    ) -> tuple[str, typing.Any]:
+        if isinstance(raw, str):
+            name, content = raw, None
+        elif isinstance(raw, dict) and len(raw) == 1:
+            [(name, content)] = raw.items()
+        else:
+            raise ValueError(f"{kls.__name__}: externally tagged value must be a string or an object with one key")
+
+        attr = self.__variant_attr__(kls, name)
+        # Variant without content is a plain string, any other is an object
+        if (getattr(kls, attr).__content_type__ is NoValue) != isinstance(raw, str):
+            raise ValueError(f"{kls.__name__}: variant `{attr}` has unexpected form {raw!r}")
+        return attr, content
+
+    def __tag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            attr: str,
+            content: typing.Any,
+    ) -> typing.Any:
+        name = kls.__names_serialization__.get(attr, attr)
+        if getattr(kls, attr).__content_type__ is NoValue:
+            return name
+        return {name: content}
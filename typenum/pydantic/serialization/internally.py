@@ -5,7 +5,7 @@ from pydantic_core import CoreSchema, core_schema, SchemaValidator
 from pydantic_core.core_schema import SerializerFunctionWrapHandler, ValidationInfo
 
 from typenum.core import NoValue, TypEnumContent
-from typenum.pydantic.serialization.tagged import TaggedSerialization
+from typenum.pydantic.serialization.tagged import TaggedSerialization, schema_ref
 
 if typing.TYPE_CHECKING:
     from ..core import TypEnumPydantic  # type: ignore
@@ -99,7 +99,7 @@ class InternallyTagged(TaggedSerialization):
             serialization=core_schema.wrap_serializer_function_ser_schema(
                 kls.__pydantic_serialization__
             ),
-            ref=f"{kls.__name__}:{id(kls)}"
+            ref=schema_ref(kls)
         )
 
     def __python_value_restore__(
@@ -138,3 +138,52 @@ class InternallyTagged(TaggedSerialization):
             result.update(**serializer(model.value))
 
         return result
+
+    def __peek_variant__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            input_value: typing.Any,
+    ) -> typing.Optional[tuple[str, typing.Any]]:
+        if not isinstance(input_value, dict) or not isinstance(name := input_value.get(self.__variant_tag__), str):
+            return None
+
+        # Content is always an object here, so it's never cached and isn't extracted
+        return kls.__names_deserialization__.get(name, name), None
+
+    def __untag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            raw: typing.Any,
+    ) -> tuple[str, typing.Any]:
+        if not isinstance(raw, dict) or self.__variant_tag__ not in raw:
+            raise ValueError(
+                f"{kls.__name__}: internally tagged value must be an object with `{self.__variant_tag__}` key"
+            )
+
+        attr = self.__variant_attr__(kls, raw[self.__variant_tag__])
+        if getattr(kls, attr).__content_type__ is NoValue:
+            if len(raw) != 1:
+                raise ValueError(f"{kls.__name__}: variant `{attr}` value must have only `{self.__variant_tag__}` key")
+            return attr, None
+        return attr, {k: v for k, v in raw.items() if k != self.__variant_tag__}
+
+    def __tag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            attr: str,
+            content: typing.Any,
+    ) -> typing.Any:
+        result = {self.__variant_tag__: kls.__names_serialization__.get(attr, attr)}
+        if getattr(kls, attr).__content_type__ is NoValue:
+            pass
+        elif not isinstance(content, dict):
+            raise ValueError(
+                f"{kls.__name__}: internally tagged content must be an object, got {type(content).__name__}"
+            )
+        elif self.__variant_tag__ in content:
+            raise ValueError(
+                f"{kls.__name__}: internally tagged content can't have `{self.__variant_tag__}` key"
+            )
+        else:
+            result.update(content)
+        return result
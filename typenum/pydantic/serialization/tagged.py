@@ -11,9 +11,19 @@ if typing.TYPE_CHECKING:
 
 __all__ = [
     "TaggedSerialization",
+    "schema_ref",
 ]
 
 
+def schema_ref(kls: type) -> str:
+    # Deterministic between processes, so generated JSON Schema is stable.
+    # Classes declared in functions can share qualname, id keeps them apart
+    ref = f"{kls.__module__}.{kls.__qualname__}"
+    if "<locals>" in kls.__qualname__:
+        ref = f"{ref}:{id(kls)}"
+    return ref
+
+
 class TaggedSerialization(ABC):
     @abstractmethod
     def __get_pydantic_core_schema__(
@@ -41,3 +51,44 @@ class TaggedSerialization(ABC):
             serializer: SerializerFunctionWrapHandler,
     ) -> typing.Any:
         raise NotImplementedError
+
+    @abstractmethod
+    def __peek_variant__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            input_value: typing.Any,
+    ) -> typing.Optional[tuple[str, typing.Any]]:
+        # Variant attribute name and raw content read without validation, None when tag not found
+        raise NotImplementedError
+
+    @abstractmethod
+    def __untag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            raw: typing.Any,
+    ) -> tuple[str, typing.Any]:
+        # Split serialized envelope into variant attribute name and untouched content
+        raise NotImplementedError
+
+    @abstractmethod
+    def __tag__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            attr: str,
+            content: typing.Any,
+    ) -> typing.Any:
+        # Wrap content into serialized envelope of variant attribute
+        raise NotImplementedError
+
+    def __variant_attr__(
+            self,
+            kls: type["TypEnumPydantic[TypEnumContent]"],
+            name: typing.Any,
+    ) -> str:
+        if not isinstance(name, str):
+            raise ValueError(f"{kls.__name__}: variant tag must be a string, got {name!r}")
+
+        attr = kls.__names_deserialization__.get(name, name)
+        if getattr(kls, attr, None) not in kls.__variants__:
+            raise ValueError(f"{kls.__name__}: unknown variant `{name}`")
+        return attr